@@ -1,24 +1,195 @@
 import asyncio
-import json
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from abc import ABC, abstractmethod
 
-# Core dependencies (install with: pip install llama-stack-client google-api-python-client slack-sdk)
-from llama_stack_client import LlamaStackClient
+# Core dependencies (install with: pip install llama-stack-client google-api-python-client slack-sdk aiohttp orjson)
+import httpx
+import orjson
+from llama_stack_client import AsyncLlamaStackClient
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
-from slack_sdk import WebClient
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
+# Optional SIMD base64 decoder (install with: pip install pybase64); same API as the stdlib
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# Optional semantic cache dependencies (install with: pip install sentence-transformers)
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# Optional exact token counting (install with: pip install tiktoken)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Token encoding loaded once at import; if the BPE file can't be fetched, fall back to estimates
+_TOKEN_ENCODING = None
+if tiktoken is not None:
+    try:
+        _TOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating token counts: {e}")
+
+# Gmail accepts at most 100 calls per batch request
+GMAIL_BATCH_SIZE = 100
+
+# Headers fetched in the metadata-only pass; with the snippet, enough to key the semantic cache
+EMAIL_KEY_HEADERS = ['Subject', 'From']
+
+# Recurring meetings larger than this are classified as team meetings without the LLM
+LARGE_MEETING_ATTENDEES = 10
+
+# Transcripts longer than this are summarized chunk by chunk before the final notes
+TRANSCRIPT_CHUNK_TOKENS = 1500
+
+# Rough token estimate used when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+
+# Emails summarized per LLM call, and body tokens sent for each
+EMAIL_SUMMARY_BATCH_SIZE = 8
+EMAIL_BODY_MAX_TOKENS = 400
+
+# Bytes decoded per body token budgeted; generous enough for multi-byte text
+BODY_DECODE_BYTES_PER_TOKEN = 4 * CHARS_PER_TOKEN
+
+LLM_MODEL_ID = "meta-llama/Llama-3.2-3B-Instruct"
+
+# Socket timeout for Google API connections, in seconds
+GOOGLE_HTTP_TIMEOUT = 30
+
+SLACK_DEFAULT_CHANNEL = '#general'
+SLACK_URGENT_PREFIX = "🚨 URGENT: "
+
+# Upper bound on in-flight LLM requests per agent (Llama Stack rate limit)
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# Connection pool shared by all LLM calls; sized well above the gather fan-out
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=512, max_keepalive_connections=256, keepalive_expiry=75)
+LLM_HTTP_TIMEOUT = httpx.Timeout(120.0)
+
+# Semantic cache: near-duplicate inputs reuse a stored completion
+SEMANTIC_CACHE_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_TTL = timedelta(days=7)
+SEMANTIC_CACHE_PATH = 'semantic_cache.json'
+
+# System prompts are static so every request shares the same prefix;
+# per-item details only ever go in the user message
+EMAIL_SYS_PROMPT = """
+You are an email analysis assistant. You receive a JSON array of emails,
+each tagged with an idx. For each email, provide:
+1. A brief summary (2-3 sentences)
+2. Priority level (High/Medium/Low)
+3. Whether action is required (Yes/No)
+4. If it mentions meetings, extract meeting details
+
+Format as JSON with key emails: an array holding one object per input email,
+with keys: idx, summary, priority, action_required, meeting_info
+""".strip()
+
+CAL_SYS_PROMPT = """
+Analyze meeting importance and provide JSON response with:
+- importance: High/Medium/Low
+- reminder_minutes: [15, 60, 1440] for different reminder times
+- preparation_needed: boolean
+- meeting_type: one-on-one/team/presentation/other
+""".strip()
+
+NOTES_SYS_PROMPT = """
+Create structured meeting notes in JSON format with:
+- summary: Brief overview of the meeting
+- key_decisions: List of decisions made
+- action_items: List of action items with owners if mentioned
+- important_topics: Main topics discussed
+- next_steps: What happens next
+""".strip()
+
+NOTES_CHUNK_SYS_PROMPT = """
+You summarize one section of a meeting transcript. List who said what that
+matters: decisions, action items with owners, open questions and key topics.
+Be concise and omit small talk.
+""".strip()
+
+# JSON schemas enforced server-side, so replies always parse
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+EMAIL_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "type": "object",
+        "properties": {
+            "emails": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "idx": {"type": "integer"},
+                        "summary": {"type": "string"},
+                        "priority": {"type": "string", "enum": ["High", "Medium", "Low"]},
+                        "action_required": {"type": "boolean"},
+                        "meeting_info": {"type": ["object", "null"]}
+                    },
+                    "required": ["idx", "summary", "priority", "action_required", "meeting_info"]
+                }
+            }
+        },
+        "required": ["emails"]
+    }
+}
+
+CAL_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "type": "object",
+        "properties": {
+            "importance": {"type": "string", "enum": ["High", "Medium", "Low"]},
+            "reminder_minutes": {"type": "array", "items": {"type": "integer"}},
+            "preparation_needed": {"type": "boolean"},
+            "meeting_type": {"type": "string", "enum": ["one-on-one", "team", "presentation", "other"]}
+        },
+        "required": ["importance", "reminder_minutes", "preparation_needed", "meeting_type"]
+    }
+}
+
+NOTES_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "key_decisions": _STRING_LIST,
+            "action_items": _STRING_LIST,
+            "important_topics": _STRING_LIST,
+            "next_steps": _STRING_LIST
+        },
+        "required": ["summary", "key_decisions", "action_items", "important_topics", "next_steps"]
+    }
+}
+
 @dataclass
 class EmailSummary:
     sender: str
@@ -38,175 +209,487 @@ class MeetingNote:
     action_items: List[str]
     key_decisions: List[str]
 
+def count_tokens(text: str) -> int:
+    """Count tokens with cl100k_base, or estimate them when tiktoken is unavailable"""
+    if _TOKEN_ENCODING is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    # Treat special-token text such as <|endoftext|> in emails and transcripts as plain text
+    return len(_TOKEN_ENCODING.encode(text, disallowed_special=()))
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens (estimated when tiktoken is unavailable)"""
+    if _TOKEN_ENCODING is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = _TOKEN_ENCODING.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return _TOKEN_ENCODING.decode(tokens[:max_tokens])
+
+class LazyEmail:
+    """Gmail message whose headers and body are parsed on first access"""
+    
+    def __init__(self, message: Dict, body_extractor: Callable[[Dict], str]):
+        self.message = message
+        self.id = message['id']
+        self._body_extractor = body_extractor
+    
+    @cached_property
+    def headers(self) -> Dict[str, str]:
+        # Header names are case-insensitive; index them once
+        return {h['name'].lower(): h['value'] for h in self.message['payload'].get('headers', [])}
+    
+    @cached_property
+    def subject(self) -> str:
+        return self.headers.get('subject', '')
+    
+    @cached_property
+    def sender(self) -> str:
+        return self.headers.get('from', '')
+    
+    @property
+    def snippet(self) -> str:
+        # Gmail's plain-text preview; present in metadata responses, so no body fetch needed
+        return self.message.get('snippet', '')
+    
+    @cached_property
+    def body(self) -> str:
+        return self._body_extractor(self.message['payload'])
+
+class ThreadLocalHttp:
+    """Authorized httplib2 client that keeps one connection pool per thread.
+    
+    httplib2.Http is not thread-safe, and Google API requests run in worker
+    threads, so each thread gets its own keep-alive AuthorizedHttp shared by
+    every service built on this object.
+    """
+    
+    def __init__(self, credentials, timeout: int = GOOGLE_HTTP_TIMEOUT):
+        self.credentials = credentials
+        self.timeout = timeout
+        self._local = threading.local()
+    
+    def _http(self) -> AuthorizedHttp:
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=self.timeout))
+        return http
+    
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        # Private names are never delegated, which also avoids recursing on _local
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._http(), name)
+
+class SemanticCache:
+    """Cache of LLM completions looked up by embedding similarity.
+    
+    Entries are partitioned by the exact system prompt, so only prompts
+    asking the same question can match each other. When a path is given,
+    entries are loaded from it on creation and written back by save(), so
+    they survive across daily runs until the TTL expires them.
+    """
+    
+    def __init__(self, model_name: str = SEMANTIC_CACHE_MODEL,
+                 threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 ttl: timedelta = SEMANTIC_CACHE_TTL,
+                 path: Optional[str] = None):
+        self.model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.ttl = ttl.total_seconds()
+        self.path = path
+        self._partitions: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            try:
+                self._load(path)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable semantic cache file {path}: {e}")
+    
+    def save(self):
+        """Write live entries to the cache file (blocking file I/O)"""
+        if not self.path:
+            return
+        
+        data = {}
+        for key, partition in self._partitions.items():
+            self._evict_expired(partition)
+            if partition['completions']:
+                data[key] = partition
+        
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_path, self.path)
+    
+    def _load(self, path: str):
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+        
+        for key, entry in data.items():
+            partition = {
+                'vectors': np.asarray(entry['vectors'], dtype=np.float32),
+                'completions': entry['completions'],
+                'created': np.asarray(entry['created'], dtype=np.float64)
+            }
+            self._evict_expired(partition)
+            if partition['completions']:
+                self._partitions[key] = partition
+    
+    def embed(self, text: str) -> "np.ndarray":
+        """Embed text as a unit vector (CPU bound, call off the event loop)"""
+        return self.model.encode(text, normalize_embeddings=True)
+    
+    def embed_many(self, texts: List[str]) -> "np.ndarray":
+        """Embed several texts in one model call, one unit vector per row"""
+        return self.model.encode(texts, normalize_embeddings=True)
+    
+    def has_entries(self, system_prompt: str) -> bool:
+        """Whether any unexpired completion is cached for this system prompt"""
+        partition = self._partitions.get(self._partition_key(system_prompt))
+        if not partition:
+            return False
+        self._evict_expired(partition)
+        return bool(partition['completions'])
+    
+    def lookup(self, system_prompt: str, vector: "np.ndarray") -> Optional[str]:
+        """Return the closest cached completion above the similarity threshold"""
+        partition = self._partitions.get(self._partition_key(system_prompt))
+        if not partition:
+            return None
+        
+        self._evict_expired(partition)
+        if not partition['completions']:
+            return None
+        
+        # Vectors are normalized, so the inner product is the cosine similarity
+        scores = partition['vectors'] @ vector
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return partition['completions'][best]
+        return None
+    
+    def insert(self, system_prompt: str, vector: "np.ndarray", completion: str):
+        """Store a completion under its input embedding"""
+        partition = self._partitions.setdefault(self._partition_key(system_prompt), {
+            'vectors': np.empty((0, vector.shape[0]), dtype=vector.dtype),
+            'completions': [],
+            'created': np.empty(0)
+        })
+        partition['vectors'] = np.vstack([partition['vectors'], vector])
+        partition['completions'].append(completion)
+        partition['created'] = np.append(partition['created'], time.time())
+    
+    def _evict_expired(self, partition: Dict[str, Any]):
+        """Drop entries older than the TTL"""
+        keep = partition['created'] > time.time() - self.ttl
+        if not keep.all():
+            partition['vectors'] = partition['vectors'][keep]
+            partition['completions'] = [c for c, k in zip(partition['completions'], keep) if k]
+            partition['created'] = partition['created'][keep]
+    
+    @staticmethod
+    def _partition_key(system_prompt: str) -> str:
+        return hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()
+
 class BaseAgent(ABC):
     """Base class for all agents in the system"""
     
-    def __init__(self, llama_client: LlamaStackClient, name: str):
+    def __init__(self, llama_client: AsyncLlamaStackClient, name: str,
+                 semantic_cache: Optional[SemanticCache] = None):
         self.llama_client = llama_client
         self.name = name
+        self.semantic_cache = semantic_cache
         self.logger = logging.getLogger(f"{__name__}.{name}")
+        self._llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
     
     @abstractmethod
     async def execute(self, *args, **kwargs):
         pass
     
-    async def get_llm_response(self, prompt: str, system_prompt: str = "") -> str:
-        """Get response from Llama model"""
+    @staticmethod
+    async def _aexec(request):
+        """Execute a blocking googleapiclient request without stalling the event loop"""
+        return await asyncio.to_thread(request.execute)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _system_message(system_prompt: str) -> Dict[str, str]:
+        """Shared system message per prompt; treat as read-only"""
+        return {"role": "system", "content": system_prompt}
+    
+    async def get_llm_response(self, prompt: str, system_prompt: str = "",
+                               response_format: Optional[Dict] = None) -> str:
+        """Get response from Llama model, constrained to response_format if given"""
         try:
+            extra = {'response_format': response_format} if response_format else {}
             response = await self.llama_client.inference.chat_completion(
-                model_id="meta-llama/Llama-3.2-3B-Instruct",
+                model_id=LLM_MODEL_ID,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    self._system_message(system_prompt),
                     {"role": "user", "content": prompt}
                 ],
-                stream=False
+                stream=False,
+                **extra
             )
             return response.completion_message.content
         except Exception as e:
             self.logger.error(f"LLM request failed: {e}")
             return ""
+    
+    async def _cache_lookup(self, cache_key: str, system_prompt: str) -> Tuple[Optional[str], Any]:
+        """Return (cached completion or None, embedding to store a fresh completion under)"""
+        if self.semantic_cache is None:
+            return None, None
+        
+        vector = await asyncio.to_thread(self.semantic_cache.embed, cache_key)
+        return self.semantic_cache.lookup(system_prompt, vector), vector
+    
+    async def _cache_lookup_many(self, cache_keys: List[str], system_prompt: str) -> List[Tuple[Optional[str], Any]]:
+        """_cache_lookup for several keys, embedded together in a single worker-thread call"""
+        if self.semantic_cache is None or not cache_keys:
+            return [(None, None)] * len(cache_keys)
+        
+        vectors = await asyncio.to_thread(self.semantic_cache.embed_many, cache_keys)
+        return [(self.semantic_cache.lookup(system_prompt, vector), vector) for vector in vectors]
+    
+    def _cache_store(self, system_prompt: str, vector: Any, response: str):
+        """Remember a completion under the embedding returned by _cache_lookup"""
+        if self.semantic_cache is not None and vector is not None and response:
+            self.semantic_cache.insert(system_prompt, vector, response)
+    
+    async def _cached_llm(self, prompt: str, system_prompt: str = "", cache_key: Optional[str] = None,
+                          response_format: Optional[Dict] = None) -> str:
+        """Get response from Llama model, reusing completions for near-duplicate inputs.
+        
+        With a response_format, replies that are not valid JSON are logged
+        and returned as "" so they are never cached.
+        """
+        cached, vector = await self._cache_lookup(cache_key or prompt, system_prompt)
+        if cached is not None:
+            return cached
+        
+        response = await self.get_llm_response(prompt, system_prompt, response_format)
+        if response and response_format is not None:
+            try:
+                orjson.loads(response)
+            except orjson.JSONDecodeError as e:
+                self.logger.error(f"LLM returned malformed JSON: {e}")
+                return ""
+        self._cache_store(system_prompt, vector, response)
+        return response
 
 class EmailAgent(BaseAgent):
     """Agent responsible for email processing and summarization"""
     
-    def __init__(self, llama_client: LlamaStackClient, gmail_service):
-        super().__init__(llama_client, "EmailAgent")
+    def __init__(self, llama_client: AsyncLlamaStackClient, gmail_service,
+                 semantic_cache: Optional[SemanticCache] = None):
+        super().__init__(llama_client, "EmailAgent", semantic_cache)
         self.gmail_service = gmail_service
     
     async def execute(self, max_emails: int = 10) -> List[EmailSummary]:
         """Process and summarize recent emails"""
         try:
             # Get recent emails
-            results = self.gmail_service.users().messages().list(
+            results = await self._aexec(self.gmail_service.users().messages().list(
                 userId='me', 
                 q='is:unread',
                 maxResults=max_emails
-            ).execute()
+            ))
             
-            messages = results.get('messages', [])
-            summaries = []
+            message_ids = [m['id'] for m in results.get('messages', [])]
             
-            for message in messages:
-                email_summary = await self._process_email(message['id'])
-                if email_summary:
-                    summaries.append(email_summary)
+            if self.semantic_cache is None or not self.semantic_cache.has_entries(EMAIL_SYS_PROMPT):
+                # Nothing cached to hit, so fetch full messages in one pass; keys are still
+                # embedded (when the cache is enabled) to store the new summaries under
+                payloads = await self._fetch_messages(message_ids, format='full')
+                emails = [LazyEmail(payloads[mid], self._extract_email_body) for mid in message_ids if mid in payloads]
+                lookups = await self._cache_lookup_many([self._cache_key(email) for email in emails], EMAIL_SYS_PROMPT)
+            else:
+                # Subject, From and snippet are enough for the cache key, so only misses need the full message
+                headers_only = await self._fetch_messages(
+                    message_ids, format='metadata', metadataHeaders=EMAIL_KEY_HEADERS
+                )
+                emails = [LazyEmail(headers_only[mid], self._extract_email_body) for mid in message_ids if mid in headers_only]
+                lookups = await self._cache_lookup_many([self._cache_key(email) for email in emails], EMAIL_SYS_PROMPT)
+                full = await self._fetch_messages(
+                    [email.id for email, (cached, _) in zip(emails, lookups) if cached is None],
+                    format='full'
+                )
+                
+                # Misses whose full fetch failed are dropped, like failed metadata fetches
+                fetched = []
+                for email, lookup in zip(emails, lookups):
+                    if lookup[0] is None:
+                        if email.id not in full:
+                            continue
+                        email.message = full[email.id]
+                    fetched.append((email, lookup))
+                emails = [email for email, _ in fetched]
+                lookups = [lookup for _, lookup in fetched]
             
-            return summaries
+            summaries: List[Optional[EmailSummary]] = [None] * len(emails)
+            misses = []
+            for i, (email, (cached, vector)) in enumerate(zip(emails, lookups)):
+                if cached is None:
+                    misses.append((i, email, vector))
+                else:
+                    summaries[i] = self._build_summary(email, orjson.loads(cached))
+            
+            # One LLM call per group of emails shares a single system-prompt prefill
+            batches = [misses[k:k + EMAIL_SUMMARY_BATCH_SIZE] for k in range(0, len(misses), EMAIL_SUMMARY_BATCH_SIZE)]
+            results = await asyncio.gather(*[self._summarize_batch(batch) for batch in batches])
+            for batch_summaries in results:
+                for i, summary in batch_summaries.items():
+                    summaries[i] = summary
+            
+            return [s for s in summaries if s is not None]
             
         except Exception as e:
             self.logger.error(f"Email processing failed: {e}")
             return []
     
-    async def _process_email(self, message_id: str) -> Optional[EmailSummary]:
-        """Process individual email"""
+    async def _fetch_messages(self, message_ids: List[str], **get_kwargs) -> Dict[str, Dict]:
+        """Fetch messages with batched Gmail requests, keyed by message id"""
+        payloads = {}
+        
+        def _on_msg(request_id, response, exception):
+            if exception is not None:
+                self.logger.error(f"Email fetch failed for {request_id}: {exception}")
+            else:
+                payloads[request_id] = response
+        
+        for i in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+            batch = self.gmail_service.new_batch_http_request(callback=_on_msg)
+            for message_id in message_ids[i:i + GMAIL_BATCH_SIZE]:
+                batch.add(
+                    self.gmail_service.users().messages().get(userId='me', id=message_id, **get_kwargs),
+                    request_id=message_id
+                )
+            await self._aexec(batch)
+        
+        return payloads
+    
+    @staticmethod
+    def _cache_key(email: LazyEmail) -> str:
+        # The snippet tells apart same-subject threads and recurring reports from one sender
+        return f"{email.subject}\n{email.sender}\n{email.snippet}"
+    
+    async def _summarize_batch(self, batch: List[Tuple[int, LazyEmail, Any]]) -> Dict[int, EmailSummary]:
+        """Summarize a group of (index, email, cache vector) with one LLM call"""
         try:
-            message = self.gmail_service.users().messages().get(
-                userId='me', 
-                id=message_id
-            ).execute()
+            # Extract bodies one by one so a single malformed email doesn't sink the group
+            items = []
+            by_idx = {}
+            for i, email, vector in batch:
+                try:
+                    items.append({'idx': i, 'subject': email.subject, 'from': email.sender, 'body': email.body})
+                except Exception as e:
+                    self.logger.error(f"Email parsing failed for {email.id}: {e}")
+                    continue
+                by_idx[i] = (email, vector)
+            if not items:
+                return {}
             
-            headers = message['payload'].get('headers', [])
-            subject = next((h['value'] for h in headers if h['name'] == 'Subject'), '')
-            sender = next((h['value'] for h in headers if h['name'] == 'From'), '')
-            
-            # Extract email body
-            body = self._extract_email_body(message['payload'])
-            
-            # Summarize with LLM
-            summary_prompt = f"""
-            Subject: {subject}
-            From: {sender}
-            Content: {body[:2000]}  # Truncate for token limits
+            summary_prompt = (
+                f"Analyze these {len(items)} emails and return one summary per email:\n"
+                f"{orjson.dumps(items).decode('utf-8')}"
+            )
             
-            Please provide a concise summary and analysis.
-            """
+            async with self._llm_semaphore:
+                response = await self.get_llm_response(summary_prompt, EMAIL_SYS_PROMPT, EMAIL_RESPONSE_FORMAT)
+            if not response:
+                return {}
             
-            system_prompt = """
-            You are an email analysis assistant. For each email, provide:
-            1. A brief summary (2-3 sentences)
-            2. Priority level (High/Medium/Low)
-            3. Whether action is required (Yes/No)
-            4. If it mentions meetings, extract meeting details
+            summaries = {}
+            for analysis in orjson.loads(response)['emails']:
+                i = analysis.pop('idx')
+                if i not in by_idx:
+                    self.logger.warning(f"LLM returned a summary for unknown email idx {i}")
+                    continue
+                email, vector = by_idx[i]
+                if i in summaries:
+                    self.logger.warning(f"LLM returned more than one summary for {email.id}; keeping the first")
+                    continue
+                summaries[i] = self._build_summary(email, analysis)
+                self._cache_store(EMAIL_SYS_PROMPT, vector, orjson.dumps(analysis).decode('utf-8'))
             
-            Format as JSON with keys: summary, priority, action_required, meeting_info
-            """
+            missing = [by_idx[i][0].id for i in by_idx if i not in summaries]
+            if missing:
+                self.logger.warning(f"LLM returned no summary for {missing}")
             
-            response = await self.get_llm_response(summary_prompt, system_prompt)
+            return summaries
             
-            try:
-                analysis = json.loads(response)
-                return EmailSummary(
-                    sender=sender,
-                    subject=subject,
-                    summary=analysis.get('summary', ''),
-                    priority=analysis.get('priority', 'Low'),
-                    action_required=analysis.get('action_required', False),
-                    meeting_info=analysis.get('meeting_info')
-                )
-            except json.JSONDecodeError:
-                # Fallback if JSON parsing fails
-                return EmailSummary(
-                    sender=sender,
-                    subject=subject,
-                    summary=response[:200],
-                    priority='Medium',
-                    action_required=True
-                )
-                
         except Exception as e:
-            self.logger.error(f"Email processing failed for {message_id}: {e}")
-            return None
+            self.logger.error(f"Email batch processing failed for {[email.id for _, email, _ in batch]}: {e}")
+            return {}
+    
+    @staticmethod
+    def _build_summary(email: LazyEmail, analysis: Dict) -> EmailSummary:
+        return EmailSummary(
+            sender=email.sender,
+            subject=email.subject,
+            summary=analysis['summary'],
+            priority=analysis['priority'],
+            action_required=analysis['action_required'],
+            meeting_info=analysis.get('meeting_info')
+        )
     
-    def _extract_email_body(self, payload: Dict) -> str:
-        """Extract text from email payload"""
+    def _extract_email_body(self, payload: Dict, max_tokens: int = EMAIL_BODY_MAX_TOKENS) -> str:
+        """Extract text from email payload, truncated to max_tokens"""
         body = ""
+        max_bytes = max_tokens * BODY_DECODE_BYTES_PER_TOKEN
         if 'parts' in payload:
             for part in payload['parts']:
                 if part['mimeType'] == 'text/plain':
-                    data = part['body']['data']
-                    body = self._decode_base64(data)
+                    # Empty parts arrive as {'size': 0} with no data
+                    data = part['body'].get('data')
+                    body = self._decode_base64(data, max_bytes) if data else ""
                     break
         elif payload['mimeType'] == 'text/plain':
-            data = payload['body']['data']
-            body = self._decode_base64(data)
+            data = payload['body'].get('data')
+            body = self._decode_base64(data, max_bytes) if data else ""
         
-        return body
+        return truncate_tokens(body, max_tokens)
     
-    def _decode_base64(self, data: str) -> str:
-        """Decode base64 email content"""
-        import base64
-        return base64.urlsafe_b64decode(data).decode('utf-8')
+    def _decode_base64(self, data: str, max_bytes: Optional[int] = None) -> str:
+        """Decode base64 email content, stopping after about max_bytes"""
+        if max_bytes is not None and len(data) > (max_bytes // 3 + 1) * 4:
+            # Decode a whole number of 4-char groups; drop a multi-byte char split at the end
+            data = data[:(max_bytes // 3 + 1) * 4]
+            return _b64.urlsafe_b64decode(data).decode('utf-8', errors='replace').rstrip('\ufffd')
+        return _b64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
 
 class CalendarAgent(BaseAgent):
     """Agent for calendar management and meeting reminders"""
     
-    def __init__(self, llama_client: LlamaStackClient, calendar_service):
-        super().__init__(llama_client, "CalendarAgent")
+    def __init__(self, llama_client: AsyncLlamaStackClient, calendar_service,
+                 semantic_cache: Optional[SemanticCache] = None):
+        super().__init__(llama_client, "CalendarAgent", semantic_cache)
         self.calendar_service = calendar_service
     
     async def execute(self, hours_ahead: int = 24) -> List[Dict]:
         """Get upcoming meetings and set reminders"""
         try:
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc)
             time_max = now + timedelta(hours=hours_ahead)
             
-            events_result = self.calendar_service.events().list(
+            events_result = await self._aexec(self.calendar_service.events().list(
                 calendarId='primary',
-                timeMin=now.isoformat() + 'Z',
-                timeMax=time_max.isoformat() + 'Z',
+                timeMin=now.isoformat(),
+                timeMax=time_max.isoformat(),
                 singleEvents=True,
                 orderBy='startTime'
-            ).execute()
+            ))
             
             events = events_result.get('items', [])
-            upcoming_meetings = []
             
-            for event in events:
-                meeting_info = await self._analyze_meeting(event)
-                if meeting_info:
-                    upcoming_meetings.append(meeting_info)
-            
-            return upcoming_meetings
+            results = await asyncio.gather(
+                *[self._analyze_meeting(event) for event in events],
+                return_exceptions=True
+            )
+            return [m for m in results if isinstance(m, dict)]
             
         except Exception as e:
             self.logger.error(f"Calendar processing failed: {e}")
@@ -220,29 +703,30 @@ class CalendarAgent(BaseAgent):
             attendees = event.get('attendees', [])
             description = event.get('description', '')
             
-            # Analyze meeting importance with LLM
-            analysis_prompt = f"""
-            Meeting: {title}
-            Description: {description}
-            Attendees: {len(attendees)} people
-            
-            Analyze this meeting's importance and suggest reminder timing.
-            """
-            
-            system_prompt = """
-            Analyze meeting importance and provide JSON response with:
-            - importance: High/Medium/Low
-            - reminder_minutes: [15, 60, 1440] for different reminder times
-            - preparation_needed: boolean
-            - meeting_type: one-on-one/team/presentation/other
-            """
-            
-            analysis = await self.get_llm_response(analysis_prompt, system_prompt)
+            analysis = self._classify_by_rules(event, attendees)
+            if analysis is None:
+                # Analyze meeting importance with LLM
+                analysis_prompt = f"""
+                Meeting: {title}
+                Description: {description}
+                Attendees: {len(attendees)} people
+                
+                Analyze this meeting's importance and suggest reminder timing.
+                """
+                
+                async with self._llm_semaphore:
+                    response = await self._cached_llm(
+                        analysis_prompt, CAL_SYS_PROMPT,
+                        cache_key=f"{title}\n{description}\n{len(attendees)} attendees",
+                        response_format=CAL_RESPONSE_FORMAT
+                    )
+                analysis = orjson.loads(response) if response else None
             
             return {
                 'id': event['id'],
                 'title': title,
                 'start_time': start_time,
+                'start_dt': self._parse_start(start_time),
                 'attendees': [a.get('email', '') for a in attendees],
                 'description': description,
                 'analysis': analysis,
@@ -253,6 +737,36 @@ class CalendarAgent(BaseAgent):
             self.logger.error(f"Meeting analysis failed: {e}")
             return None
     
+    def _parse_start(self, start_time: Optional[str]) -> Optional[datetime]:
+        """Parse the start once so reminders don't re-parse; all-day dates are local midnight"""
+        try:
+            return datetime.fromisoformat(start_time).astimezone()
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"Unparseable meeting start {start_time!r}: {e}")
+            return None
+    
+    @staticmethod
+    def _classify_by_rules(event: Dict, attendees: List[Dict]) -> Optional[Dict]:
+        """Analysis for meetings whose importance follows from their structure, else None"""
+        if not event.get('recurringEventId'):
+            return None
+        
+        if len(attendees) == 2:
+            return {
+                'importance': 'Low',
+                'reminder_minutes': [15],
+                'preparation_needed': False,
+                'meeting_type': 'one-on-one'
+            }
+        if len(attendees) > LARGE_MEETING_ATTENDEES:
+            return {
+                'importance': 'Medium',
+                'reminder_minutes': [15],
+                'preparation_needed': False,
+                'meeting_type': 'team'
+            }
+        return None
+    
     def _extract_meet_link(self, event: Dict) -> Optional[str]:
         """Extract Google Meet link from event"""
         conference_data = event.get('conferenceData', {})
@@ -267,43 +781,50 @@ class CalendarAgent(BaseAgent):
 class MeetingNotesAgent(BaseAgent):
     """Agent for taking and summarizing meeting notes"""
     
-    def __init__(self, llama_client: LlamaStackClient, docs_service):
+    def __init__(self, llama_client: AsyncLlamaStackClient, docs_service):
         super().__init__(llama_client, "MeetingNotesAgent")
         self.docs_service = docs_service
     
     async def execute(self, meeting_transcript: str, meeting_info: Dict) -> MeetingNote:
         """Process meeting transcript and create notes"""
         try:
+            title = meeting_info.get('title', 'Unknown Meeting')
+            chunks = self._chunk_transcript(meeting_transcript)
+            
+            if len(chunks) > 1:
+                # Map: summarize sections concurrently; reduce: build notes from the summaries
+                partials = await asyncio.gather(*[self._summarize_chunk(title, chunk) for chunk in chunks])
+                failed = [n for n, partial in enumerate(partials, 1) if not partial]
+                if failed:
+                    # Notes built from missing sections would silently omit parts of the meeting
+                    self.logger.error(
+                        f"Meeting notes processing failed: no summary for transcript chunks {failed} of {len(chunks)}"
+                    )
+                    return None
+                transcript_label = "Section summaries"
+                transcript_text = "\n\n".join(partials)
+            else:
+                transcript_label = "Transcript"
+                transcript_text = meeting_transcript
+            
             # Analyze transcript with LLM
             analysis_prompt = f"""
-            Meeting: {meeting_info.get('title', 'Unknown Meeting')}
-            Transcript: {meeting_transcript}
+            Meeting: {title}
+            {transcript_label}: {transcript_text}
             
             Please analyze this meeting and provide structured notes.
             """
             
-            system_prompt = """
-            Create structured meeting notes in JSON format with:
-            - summary: Brief overview of the meeting
-            - key_decisions: List of decisions made
-            - action_items: List of action items with owners if mentioned
-            - important_topics: Main topics discussed
-            - next_steps: What happens next
-            """
-            
-            analysis = await self.get_llm_response(analysis_prompt, system_prompt)
+            analysis = await self.get_llm_response(analysis_prompt, NOTES_SYS_PROMPT, NOTES_RESPONSE_FORMAT)
+            if not analysis:
+                self.logger.error("Meeting notes processing failed: no response from LLM")
+                return None
             
             try:
-                notes_data = json.loads(analysis)
-            except json.JSONDecodeError:
-                # Fallback structure
-                notes_data = {
-                    'summary': analysis[:500],
-                    'key_decisions': [],
-                    'action_items': [],
-                    'important_topics': [],
-                    'next_steps': []
-                }
+                notes_data = orjson.loads(analysis)
+            except orjson.JSONDecodeError as e:
+                self.logger.error(f"Meeting notes processing failed: malformed LLM JSON: {e}")
+                return None
             
             # Create meeting note object
             meeting_note = MeetingNote(
@@ -325,6 +846,34 @@ class MeetingNotesAgent(BaseAgent):
             self.logger.error(f"Meeting notes processing failed: {e}")
             return None
     
+    @staticmethod
+    def _chunk_transcript(transcript: str) -> List[str]:
+        """Split a transcript on speaker turns into chunks of at most TRANSCRIPT_CHUNK_TOKENS"""
+        chunks = []
+        current: List[str] = []
+        current_tokens = 0
+        
+        for line in transcript.splitlines():
+            line_tokens = count_tokens(line)
+            if current and current_tokens + line_tokens > TRANSCRIPT_CHUNK_TOKENS:
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+            current.append(line)
+            current_tokens += line_tokens
+        
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+    
+    async def _summarize_chunk(self, title: str, chunk: str) -> str:
+        """Summarize one transcript section"""
+        chunk_prompt = f"""
+        Meeting: {title}
+        Transcript section: {chunk}
+        """
+        async with self._llm_semaphore:
+            return await self.get_llm_response(chunk_prompt, NOTES_CHUNK_SYS_PROMPT)
+    
     async def _save_to_docs(self, meeting_note: MeetingNote, notes_data: Dict):
         """Save meeting notes to Google Docs"""
         try:
@@ -335,32 +884,30 @@ class MeetingNotesAgent(BaseAgent):
                 'title': doc_title
             }
             
-            doc = self.docs_service.documents().create(body=document).execute()
+            doc = await self._aexec(self.docs_service.documents().create(body=document))
             doc_id = doc.get('documentId')
             
             # Prepare content
-            content = f"""
-MEETING NOTES
-
-Meeting: {meeting_note.title}
-Date: {meeting_note.date.strftime('%Y-%m-%d %H:%M')}
-Participants: {', '.join(meeting_note.participants)}
-
-SUMMARY
-{meeting_note.summary}
-
-KEY DECISIONS
-{chr(10).join(f"• {decision}" for decision in meeting_note.key_decisions)}
-
-ACTION ITEMS
-{chr(10).join(f"• {item}" for item in meeting_note.action_items)}
-
-IMPORTANT TOPICS
-{chr(10).join(f"• {topic}" for topic in notes_data.get('important_topics', []))}
-
-NEXT STEPS
-{chr(10).join(f"• {step}" for step in notes_data.get('next_steps', []))}
-            """
+            parts = [
+                "MEETING NOTES",
+                "",
+                f"Meeting: {meeting_note.title}",
+                f"Date: {meeting_note.date.strftime('%Y-%m-%d %H:%M')}",
+                f"Participants: {', '.join(meeting_note.participants)}",
+                "",
+                "SUMMARY",
+                meeting_note.summary
+            ]
+            for heading, items in (
+                ("KEY DECISIONS", meeting_note.key_decisions),
+                ("ACTION ITEMS", meeting_note.action_items),
+                ("IMPORTANT TOPICS", notes_data.get('important_topics', [])),
+                ("NEXT STEPS", notes_data.get('next_steps', []))
+            ):
+                parts.append("")
+                parts.append(heading)
+                parts.extend(f"• {item}" for item in items)
+            content = "\n".join(parts)
             
             # Insert content
             requests = [
@@ -372,10 +919,10 @@ NEXT STEPS
                 }
             ]
             
-            self.docs_service.documents().batchUpdate(
+            await self._aexec(self.docs_service.documents().batchUpdate(
                 documentId=doc_id,
                 body={'requests': requests}
-            ).execute()
+            ))
             
             self.logger.info(f"Meeting notes saved to Google Docs: {doc_id}")
             
@@ -385,7 +932,7 @@ NEXT STEPS
 class NotificationAgent(BaseAgent):
     """Agent for sending notifications via Slack"""
     
-    def __init__(self, llama_client: LlamaStackClient, slack_client: WebClient):
+    def __init__(self, llama_client: AsyncLlamaStackClient, slack_client: AsyncWebClient):
         super().__init__(llama_client, "NotificationAgent")
         self.slack_client = slack_client
     
@@ -393,10 +940,10 @@ class NotificationAgent(BaseAgent):
         """Send notification to Slack"""
         try:
             if urgent:
-                message = f"🚨 URGENT: {message}"
+                message = SLACK_URGENT_PREFIX + message
             
-            response = self.slack_client.chat_postMessage(
-                channel=channel or '#general',
+            response = await self.slack_client.chat_postMessage(
+                channel=channel or SLACK_DEFAULT_CHANNEL,
                 text=message,
                 username='AI Assistant'
             )
@@ -411,6 +958,8 @@ class AgenticWorkSystem:
     
     def __init__(self):
         self.llama_client = None
+        self.llm_http_client = None
+        self.semantic_cache = None
         self.agents = {}
         self.google_services = {}
         self.slack_client = None
@@ -418,21 +967,34 @@ class AgenticWorkSystem:
     async def initialize(self, config: Dict):
         """Initialize all services and agents"""
         try:
-            # Initialize Llama Stack client
-            self.llama_client = LlamaStackClient(
-                base_url=config.get('llama_stack_url', 'http://localhost:5000')
+            # Initialize Llama Stack client on a pooled keep-alive HTTP client
+            self.llm_http_client = httpx.AsyncClient(limits=LLM_HTTP_LIMITS, timeout=LLM_HTTP_TIMEOUT)
+            self.llama_client = AsyncLlamaStackClient(
+                base_url=config.get('llama_stack_url', 'http://localhost:5000'),
+                http_client=self.llm_http_client
             )
             
-            # Initialize Google services
-            await self._setup_google_services(config['google_credentials'])
+            # Semantic cache for repeated email/meeting analysis
+            load_cache = config.get('semantic_cache', True)
+            if load_cache and SentenceTransformer is None:
+                logger.warning("sentence-transformers not installed; semantic cache disabled")
+                load_cache = False
+            
+            # Google services, embedding model and the first LLM connection set up concurrently
+            setup = [self._setup_google_services(config['google_credentials']), self._warm_up_llm()]
+            if load_cache:
+                setup.append(self._load_semantic_cache(config.get('semantic_cache_path', SEMANTIC_CACHE_PATH)))
+            results = await asyncio.gather(*setup)
+            if load_cache:
+                self.semantic_cache = results[-1]
             
             # Initialize Slack client
-            self.slack_client = WebClient(token=config['slack_token'])
+            self.slack_client = AsyncWebClient(token=config['slack_token'])
             
             # Initialize agents
             self.agents = {
-                'email': EmailAgent(self.llama_client, self.google_services['gmail']),
-                'calendar': CalendarAgent(self.llama_client, self.google_services['calendar']),
+                'email': EmailAgent(self.llama_client, self.google_services['gmail'], self.semantic_cache),
+                'calendar': CalendarAgent(self.llama_client, self.google_services['calendar'], self.semantic_cache),
                 'notes': MeetingNotesAgent(self.llama_client, self.google_services['docs']),
                 'notification': NotificationAgent(self.llama_client, self.slack_client)
             }
@@ -441,10 +1003,60 @@ class AgenticWorkSystem:
             
         except Exception as e:
             logger.error(f"System initialization failed: {e}")
+            # main() only shuts down after a successful initialize; release what was opened here
+            await self.shutdown()
             raise
     
+    async def shutdown(self):
+        """Persist the semantic cache and release pooled connections"""
+        if self.semantic_cache is not None:
+            try:
+                await asyncio.to_thread(self.semantic_cache.save)
+            except Exception as e:
+                logger.warning(f"Failed to save semantic cache: {e}")
+        
+        if self.llm_http_client is not None:
+            await self.llm_http_client.aclose()
+            self.llm_http_client = None
+    
+    async def _load_semantic_cache(self, path: str) -> Optional[SemanticCache]:
+        """Load the embedding model and cached entries; the cache is optional, so failures only disable it"""
+        try:
+            return await asyncio.to_thread(SemanticCache, path=path)
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable, continuing without it: {e}")
+            return None
+    
+    async def _warm_up_llm(self):
+        """Open a connection to Llama Stack ahead of the first real request"""
+        try:
+            await self.llama_client.inference.chat_completion(
+                model_id=LLM_MODEL_ID,
+                messages=[{"role": "user", "content": "ping"}],
+                sampling_params={"max_tokens": 1},
+                stream=False
+            )
+        except Exception as e:
+            logger.warning(f"LLM warm-up failed: {e}")
+    
     async def _setup_google_services(self, credentials_path: str):
         """Setup Google API services"""
+        creds = await asyncio.to_thread(self._load_google_credentials, credentials_path)
+        
+        # One keep-alive connection pool per thread, shared across services
+        http = ThreadLocalHttp(creds)
+        gmail, calendar, docs = await asyncio.gather(*[
+            asyncio.to_thread(build, name, version, http=http)
+            for name, version in [('gmail', 'v1'), ('calendar', 'v3'), ('docs', 'v1')]
+        ])
+        self.google_services = {
+            'gmail': gmail,
+            'calendar': calendar,
+            'docs': docs
+        }
+    
+    def _load_google_credentials(self, credentials_path: str) -> Credentials:
+        """Load cached OAuth credentials, refreshing or re-authorizing as needed"""
         SCOPES = [
             'https://www.googleapis.com/auth/gmail.readonly',
             'https://www.googleapis.com/auth/calendar',
@@ -466,11 +1078,7 @@ class AgenticWorkSystem:
             with open('token.json', 'w') as token:
                 token.write(creds.to_json())
         
-        self.google_services = {
-            'gmail': build('gmail', 'v1', credentials=creds),
-            'calendar': build('calendar', 'v3', credentials=creds),
-            'docs': build('docs', 'v1', credentials=creds)
-        }
+        return creds
     
     async def run_daily_workflow(self):
         """Execute the complete daily workflow"""
@@ -504,9 +1112,9 @@ class AgenticWorkSystem:
         
         if emails:
             summary_parts.append(f"📧 Emails processed: {len(emails)}")
-            high_priority = [e for e in emails if e.priority == 'High']
+            high_priority = sum(1 for e in emails if e.priority == 'High')
             if high_priority:
-                summary_parts.append(f"⚠️ High priority emails: {len(high_priority)}")
+                summary_parts.append(f"⚠️ High priority emails: {high_priority}")
         
         if meetings:
             summary_parts.append(f"📅 Upcoming meetings: {len(meetings)}")
@@ -518,21 +1126,27 @@ class AgenticWorkSystem:
     
     async def _schedule_meeting_reminders(self, meetings: List[Dict]):
         """Schedule reminders for upcoming meetings"""
+        now = datetime.now(timezone.utc)
+        reminders = []
         for meeting in meetings:
+            if meeting.get('start_dt') is None:
+                continue
             try:
-                start_time = datetime.fromisoformat(meeting['start_time'].replace('Z', '+00:00'))
-                now = datetime.now().replace(tzinfo=start_time.tzinfo)
+                starts_in = meeting['start_dt'] - now
                 
                 # Send reminder if meeting is within 30 minutes
-                if timedelta(minutes=15) <= (start_time - now) <= timedelta(minutes=30):
-                    reminder_msg = f"🔔 Reminder: '{meeting['title']}' starts in {int((start_time - now).total_seconds() // 60)} minutes"
+                if timedelta(minutes=15) <= starts_in <= timedelta(minutes=30):
+                    reminder_msg = f"🔔 Reminder: '{meeting['title']}' starts in {int(starts_in.total_seconds() // 60)} minutes"
                     if meeting.get('meet_link'):
                         reminder_msg += f"\nJoin: {meeting['meet_link']}"
-                    
-                    await self.agents['notification'].execute(reminder_msg, urgent=True)
+                    reminders.append(reminder_msg)
                     
             except Exception as e:
                 logger.error(f"Failed to schedule reminder for {meeting.get('title', 'Unknown')}: {e}")
+        
+        # All due reminders go out in one Slack message
+        if reminders:
+            await self.agents['notification'].execute("\n\n".join(reminders), urgent=True)
     
     async def process_meeting_transcript(self, transcript: str, meeting_info: Dict):
         """Process meeting transcript and create notes"""
@@ -566,29 +1180,31 @@ async def main():
     system = AgenticWorkSystem()
     await system.initialize(config)
     
-    # Run daily workflow
-    await system.run_daily_workflow()
-    
-    # Example: Process a meeting transcript
-    sample_transcript = """
-    Meeting started at 2:00 PM
-    John: Let's review the project timeline
-    Sarah: We need to finish the MVP by next Friday
-    Mike: I'll handle the backend integration
-    John: Great, let's set up a follow-up meeting for Thursday
-    """
-    
-    sample_meeting_info = {
-        'id': 'meeting123',
-        'title': 'Project Review',
-        'attendees': ['john@company.com', 'sarah@company.com', 'mike@company.com']
-    }
-    
-    meeting_note = await system.process_meeting_transcript(sample_transcript, sample_meeting_info)
-    
-    if meeting_note:
-        print(f"Meeting notes created: {meeting_note.summary}")
+    try:
+        # Run daily workflow
+        await system.run_daily_workflow()
+        
+        # Example: Process a meeting transcript
+        sample_transcript = """
+        Meeting started at 2:00 PM
+        John: Let's review the project timeline
+        Sarah: We need to finish the MVP by next Friday
+        Mike: I'll handle the backend integration
+        John: Great, let's set up a follow-up meeting for Thursday
+        """
+        
+        sample_meeting_info = {
+            'id': 'meeting123',
+            'title': 'Project Review',
+            'attendees': ['john@company.com', 'sarah@company.com', 'mike@company.com']
+        }
+        
+        meeting_note = await system.process_meeting_transcript(sample_transcript, sample_meeting_info)
+        
+        if meeting_note:
+            print(f"Meeting notes created: {meeting_note.summary}")
+    finally:
+        await system.shutdown()
 
 if __name__ == "__main__":
-    import os
     asyncio.run(main())